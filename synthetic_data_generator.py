@@ -1,12 +1,17 @@
 import csv
 import json
+import multiprocessing
 import os
-import secrets
+import random
 import string
-import uuid
+import sys
 from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import cache
+from itertools import starmap
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Callable, Iterable, Iterator, Optional, TextIO
 
 # NOTE: no external dependencies are required
 
@@ -47,11 +52,10 @@ GENERATE_INSERT_STATEMENTS: bool = bool(
     os.environ.get("SYNTHGEN_GENERATE_INSERT_STATEMENTS", True)
 )
 
-# Decide whether generated outputs are written into a file or printed
-if OUTPUT_FILE := os.environ.get("SYNTHGEN_OUTPUT_FILE", False):
-    OUTPUT_STREAM: callable = Path(OUTPUT_FILE).open("w").write
-else:
-    OUTPUT_STREAM: callable = print
+# Path to the file where outputs are written, if not set, they are printed
+OUTPUT_FILE: Optional[str] = os.environ.get("SYNTHGEN_OUTPUT_FILE", None)
+# Size of the buffer used when outputs are written into a file (in bytes):
+OUTPUT_BUFFER_SIZE: int = 1 << 20
 
 # Maximal size of generated strings (e. g. varchar) in database:
 MAX_STRING_SIZE: int = int(os.environ.get("SYNTHGEN_MAX_STRING_SIZE", 20))
@@ -65,48 +69,52 @@ NULL_PROBABILITY = float(os.environ.get("SYNTHGEN_NULL_PROBABILITY_PERCENT", 20)
 PRIMARY_KEYS_PATH: Path = Path(
     os.environ.get("SYNTHGEN_PRIMARY_KEYS_PATH", "inputs/PRIMARY_KEYS.json")
 )
+# Seed for the random generator (if not set, outputs differ on each run)
+RANDOM_SEED: Optional[str] = os.environ.get("SYNTHGEN_RANDOM_SEED", None)
+# Number of processes that generate INSERT statements (table by table)
+NUMBER_OF_PROCESSES: int = int(
+    os.environ.get("SYNTHGEN_NUMBER_OF_PROCESSES", os.cpu_count() or 1)
+)
 # -----------------------------------
 
 # =========== OPTIONS ===============
-# Characters that occurs in generated strings (whole alphabet and digits)
+# Characters that occurs in generated strings (whole alphabet and digits),
+#   only ASCII characters are supported
 alphabet: str = string.ascii_letters + string.digits
+# Maps each byte value to a character of the alphabet (as 256 is not
+#   a multiple of the alphabet size, first few characters are slightly
+#   more frequent, which does not matter for synthetic data)
+_ALPHABET_TABLE: bytes = (alphabet * (256 // len(alphabet) + 1)).encode()[:256]
+# Source of randomness (synthetic data do not need a cryptographically
+#   secure generator, Mersenne Twister is much faster)
+_RNG: random.Random = random.Random(RANDOM_SEED)
+# Data types whose definition includes the size (e. g. varchar(20))
+sized_data_types: frozenset[str] = frozenset(
+    {"char", "varchar", "nchar", "nvarchar", "varbinary", "binary"}
+)
+# Generated dates and times are between these two moments
+minimal_datetime: datetime = datetime(1970, 1, 1)
+maximal_datetime: datetime = datetime(2030, 1, 1)
+# Maximal number of integers whose string representations are precomputed
+numeric_representations_limit: int = 1 << 16
+# How many more candidates are drawn for primary keys (to replace duplicates)
+primary_key_oversampling: float = 1.3
 # -----------------------------------
 
 
 # ======== FUNCTIONALITY ============
-def parse_csv(
-    path_to_csv: Path, column_names: list[str]
-) -> tuple[int, dict[str, list[str | int]]]:
-    """Transform input CSV file into dictionary with names of columns as
-        a key and column values as an array (dictionary value).
-    Args:
-         path_to_csv (Path): Path to CSV file that is parsed.
-         column_names (list[str]): List of column names.
-    Returns:
-        tuple[int, dict[str, list[str | int]]]: size of CSV (how many rows) and
-            mapped CSV file as a dictionary. E. g.:
-            (50, {"COLUMN_1": [1, "2nd row value", 3, ...], ...})
-    """
-    parsed_csv: dict[str, list[str | int]] = defaultdict(list)
-    csv_size: int = 0
-    with path_to_csv.open() as _csv_file:
-        _csv_rows = csv.reader(_csv_file, delimiter=",")
-        for _csv_row in _csv_rows:
-            csv_size += 1
-            for _position, _column in enumerate(column_names):
-                parsed_csv[_column].append(_csv_row[_position])
-    return csv_size, parsed_csv
-
-
-def generate_table_definitions(
-    number_of_rows_in_csv: int, parsed_table_def_csv: dict[str, list[str | int]]
+def build_table_definitions(
+    table_def_rows: Iterable[tuple[str, str, str, str, str, str]]
 ) -> dict[str, dict[str, str | bool | Optional[int]]]:
     """Generates a dictionary that defines tables and columns inside tables.
 
     Args:
-        number_of_rows_in_csv (int): Number of rows included in CSV.
-        parsed_table_def_csv (dict[str, list[str | int]]): Definition of
-            tables as interpreted CSV (see the return value of parse_csv).
+        table_def_rows (Iterable[tuple[str, str, str, str, str, str]]): Rows
+            of the CSV file that defines the structure of the database,
+            reduced to values of TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME,
+            IS_NULLABLE, DATA_TYPE and CHARACTER_MAXIMUM_LENGTH (in this
+            order). Rows are consumed one by one, so they do not need to be
+            kept in memory.
 
     Returns:
         dict[str, dict[str, str | bool | Optional[int]]]: Definition of tables
@@ -123,54 +131,59 @@ def generate_table_definitions(
     """
     _table_defs: dict = defaultdict(dict)
 
-    for _row_pos in range(number_of_rows_in_csv):
+    for (
+        _schema,
+        _table,
+        _column,
+        _is_nullable,
+        _data_type,
+        _max_len,
+    ) in table_def_rows:
         # Reconstruct the full table name as TABLE_SCHEMA.TABLE_NAME
-        _full_tbl_name = (
-            f"{parsed_table_def_csv['TABLE_SCHEMA'][_row_pos]}."
-            f"{parsed_table_def_csv['TABLE_NAME'][_row_pos]}"
-        )
+        _full_tbl_name = f"{_schema}.{_table}"
 
         # Treat maximum length (if NULL set to None, otherwise integer)
-        _max_len = parsed_table_def_csv["CHARACTER_MAXIMUM_LENGTH"][_row_pos]
         if _max_len == "NULL":
             _max_len = None
         else:
             _max_len = int(_max_len)
 
-        # Construct definition of a single column
-        _column_definition = {
-            parsed_table_def_csv["COLUMN_NAME"][_row_pos]: {
-                "data_type": parsed_table_def_csv["DATA_TYPE"][_row_pos],
-                "is_nullable": parsed_table_def_csv["IS_NULLABLE"][_row_pos] == "YES",
-                "max_length": _max_len,  # Maximal length of varchar-like cols
-            }
+        # Add a definition of a single column into a table definition
+        _table_defs[_full_tbl_name][_column] = {
+            "data_type": _data_type,
+            "is_nullable": _is_nullable == "YES",
+            "max_length": _max_len,  # Maximal length of varchar-like cols
         }
-        # Add a column into a table definition
-        _table_defs[_full_tbl_name] |= _column_definition
 
     return _table_defs
 
 
-def pad_string_by_apostrophes(input_string: str) -> str:
-    """Add apostrophe symbols around string.
+@cache
+def numeric_representations(number_of_values: int, divisor: int = 1) -> tuple[str, ...]:
+    """Precompute string representations of numbers 0, 1, ... (divided by
+        divisor, if it is not 1).
     Note:
-        This function is added to make code more readable.
+        Results are cached, so each sequence is computed only once.
     Args:
-        input_string (str): input string that is extended.
+        number_of_values (int): how many numbers are represented.
+        divisor (int): divisor of each number (1 for integers).
     Returns:
-        str: String with apostrophes around
+        tuple[str, ...]: representations of numbers ordered by their value
     """
-    return f"'{input_string}'"
+    if divisor == 1:
+        return tuple(map(str, range(number_of_values)))
+    return tuple(str(_value / divisor) for _value in range(number_of_values))
 
 
-def random_value(
+def compile_column_generator(
     data_type: str,
     str_size: int,
     bin_size: int,
     int_max: int,
     null_probability: Optional[float],
-) -> Any:
-    """Generates random sequence for given type.
+) -> Callable[[int], list[str]]:
+    """Resolves the data type of a column once and returns a function that
+        generates random values for the column.
     Note:
         Uses only types that occur in MS SQL database -> not universal.
         I. e. if you need additional data types, add them here.
@@ -184,61 +197,171 @@ def random_value(
     Raises:
         NotImplementedError: in the case there is no match to data type
     Returns:
-        Any: random value for given type
+        Callable[[int], list[str]]: function that generates given number of
+            random values for the column (formatted for SQL)
     """
-    if null_probability:
-        # Treats null value
-        if secrets.SystemRandom().uniform(0, 1) <= null_probability:
-            return "NULL"
-
     match data_type:
         case "bit":
-            return int(secrets.randbits(1))
+            _representations = numeric_representations(2)
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                return _RNG.choices(_representations, k=number_of_values)
+
         case "char" | "varchar" | "text" | "nchar" | "nvarchar" | "ntext":
-            return pad_string_by_apostrophes(
-                "".join(secrets.choice(alphabet) for _ in range(str_size))
-            )
-        case "bigint" | "numeric" | "decimal" | "int":
-            return secrets.randbelow(int_max)
-        case "smallint":
-            return secrets.randbelow(min(32767, int_max))
-        case "tinyint":
-            return secrets.randbelow(min(256, int_max))
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                # Draw characters for the whole column at once (as random
+                #   bytes mapped to the alphabet) and slice them
+                _chars = (
+                    _RNG.randbytes(number_of_values * str_size)
+                    .translate(_ALPHABET_TABLE)
+                    .decode("ascii")
+                )
+                return [
+                    f"'{_chars[_pos * str_size:(_pos + 1) * str_size]}'"
+                    for _pos in range(number_of_values)
+                ]
+
+        case "bigint" | "numeric" | "decimal" | "int" | "smallint" | "tinyint":
+            # Resolve the upper bound for given integer type
+            _upper_bound = {"smallint": 32767, "tinyint": 256}.get(data_type, int_max)
+            _upper_bound = min(_upper_bound, int_max)
+
+            if _upper_bound <= numeric_representations_limit:
+                # Draw from precomputed string representations of all values
+                _representations = numeric_representations(_upper_bound)
+
+                def _generate_values(number_of_values: int) -> list[str]:
+                    return _RNG.choices(_representations, k=number_of_values)
+
+            else:
+                _population = range(_upper_bound)
+
+                def _generate_values(number_of_values: int) -> list[str]:
+                    return [
+                        str(_value)
+                        for _value in _RNG.choices(_population, k=number_of_values)
+                    ]
+
         case "float":
-            return secrets.randbelow(min(256, int_max)) / 50
+            _representations = numeric_representations(min(256, int_max), 50)
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                return _RNG.choices(_representations, k=number_of_values)
+
         case "varbinary" | "binary":
-            return f"CAST({secrets.randbits(bin_size)} AS BINARY({bin_size}))"
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                # Binary literal with bin_size random bytes (e. g. 0x1F0A)
+                return [
+                    "0x" + _RNG.randbytes(bin_size).hex()
+                    for _ in range(number_of_values)
+                ]
+
         case "date":
-            return pad_string_by_apostrophes(
-                f"{1970 + secrets.randbelow(60)}-"
-                f"{1 + secrets.randbelow(12):02}-"
-                f"{1 + secrets.randbelow(27):02}"
-            )
+            _start = minimal_datetime.date()
+            _span = (maximal_datetime - minimal_datetime).days
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                # Formatted in ISO format (e. g. '2023-12-31')
+                return [
+                    f"'{_start + timedelta(days=_RNG.randrange(_span))}'"
+                    for _ in range(number_of_values)
+                ]
+
         case "datetime" | "datetime2":
-            return pad_string_by_apostrophes(
-                f"{1970 + secrets.randbelow(60)}-"
-                f"{1 + secrets.randbelow(12):02}-"
-                f"{1 + secrets.randbelow(27):02} "
-                f"{secrets.randbelow(24):02}:"
-                f"{secrets.randbelow(60):02}:"
-                f"{secrets.randbelow(60):02}"
-            )
+            _start = minimal_datetime
+            _span = int((maximal_datetime - minimal_datetime).total_seconds())
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                # Formatted in ISO format (e. g. '2023-12-31 23:59:59')
+                return [
+                    f"'{_start + timedelta(seconds=_RNG.randrange(_span))}'"
+                    for _ in range(number_of_values)
+                ]
+
         case "time":
-            return pad_string_by_apostrophes(
-                f"{secrets.randbelow(24):02}:"
-                f"{secrets.randbelow(60):02}:"
-                f"{secrets.randbelow(60):02}"
-            )
+            _start = minimal_datetime
+            _span = 24 * 60 * 60  # one day (in seconds)
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                # Formatted in ISO format (e. g. '23:59:59')
+                return [
+                    f"'{(_start + timedelta(seconds=_RNG.randrange(_span))).time()}'"
+                    for _ in range(number_of_values)
+                ]
+
         case "timestamp":
-            # This is a binary(8) equivalent
-            return "DEFAULT"
+
+            def _generate_values(number_of_values: int) -> list[str]:
+                # This is a binary(8) equivalent
+                return ["DEFAULT"] * number_of_values
+
         case "uniqueidentifier":
-            return (
-                "CONVERT(uniqueidentifier, "
-                f"{pad_string_by_apostrophes(str(uuid.uuid4()))})"
-            )
 
-    raise NotImplementedError(f"unsupported data type {data_type}")
+            def _generate_values(number_of_values: int) -> list[str]:
+                # Draw 16 bytes per value at once, format them as 8-4-4-4-12
+                #   hexadecimal digits (that is 32 digits per value)
+                _hex = _RNG.randbytes(16 * number_of_values).hex()
+                return [
+                    f"CONVERT(uniqueidentifier, '{_hex[_p:_p + 8]}-"
+                    f"{_hex[_p + 8:_p + 12]}-{_hex[_p + 12:_p + 16]}-"
+                    f"{_hex[_p + 16:_p + 20]}-{_hex[_p + 20:_p + 32]}')"
+                    for _p in range(0, len(_hex), 32)
+                ]
+
+        case _:
+            raise NotImplementedError(f"unsupported data type {data_type}")
+
+    if not null_probability:
+        return _generate_values
+
+    # Bound method is resolved once (not for each value)
+    _random = _RNG.random
+
+    def _generate_nullable_values(number_of_values: int) -> list[str]:
+        # Treats null values (replaces them with given probability)
+        return [
+            "NULL" if _random() <= null_probability else _value
+            for _value in _generate_values(number_of_values)
+        ]
+
+    return _generate_nullable_values
+
+
+@cache
+def column_type_definition(
+    data_type: str, max_length: Optional[int], is_nullable: bool
+) -> str:
+    """Generate the part of column definition (in CREATE TABLE statement)
+        that follows the name of the column.
+    Note:
+        Results are cached, as the same definitions repeat across tables.
+    Args:
+        data_type (str): T-SQL data type of the column.
+        max_length (Optional[int]): Maximal length of varchar-like columns
+            (negative if unlimited, None if not applicable).
+        is_nullable (bool): True if the column can contain NULL values.
+    Return:
+        str: Definition of the column type (e. g. "varchar(20) NOT NULL")
+    """
+    # Perform a special treatment for some data types
+    _data_type_def = data_type
+    if _data_type_def in sized_data_types:
+        # Get the maximal length for varchar-like columns
+        _max_length: Optional[int] | str = max_length
+        if _max_length is not None and _max_length < 0:
+            # Special treatment when the value is -1 -> the size is unlimited
+            _max_length = "max"
+        _data_type_def += f"({_max_length})"
+    elif _data_type_def == "bit":
+        _data_type_def = "BIT"
+
+    # Add NOT NULL to column definition if required
+    _not_null = ""
+    if not is_nullable:
+        _not_null += "NOT NULL"
+    return f"{_data_type_def} {_not_null}"
 
 
 def create_statement(
@@ -251,35 +374,23 @@ def create_statement(
         table_name (str): name of the table.
         table_def (dict[str, dict[str, str | bool | Optional[int]]]):
             definition of the table (see return val of
-            generate_table_definitions function).
+            build_table_definitions function).
         primary_keys (Optional[list[str]]): List of columns that are primary
             keys (or None if none of them is).
     Return:
         str: Create statement for table
     """
     _column_definitions: list[str] = []
-    for _column in table_def.keys():
-        # Get the maximal length for varchar-like columns
-        _max_length: Optional[int] | str = table_def[_column]["max_length"]
-        if _max_length is not None and _max_length < 0:
-            # Special treatment when the value is -1 -> the size is unlimited
-            _max_length = "max"
-
-        # Perform a special treatment for some data types
-        match _data_type_def := table_def[_column]["data_type"]:
-            case "char" | "varchar" | "nchar" | "nvarchar":
-                _data_type_def += f"({_max_length})"
-            case "varbinary" | "binary":
-                _data_type_def += f"({_max_length})"
-            case "bit":
-                _data_type_def = "BIT"
-
-        # Add NOT NULL to column definition if required
-        _not_null = ""
-        if not table_def[_column]["is_nullable"]:
-            _not_null += "NOT NULL"
+    for _column, _column_def in table_def.items():
         # Defines one column
-        _column_definitions.append(f"[{_column}] {_data_type_def} {_not_null}")
+        _column_definitions.append(
+            f"[{_column}] "
+            + column_type_definition(
+                _column_def["data_type"],
+                _column_def["max_length"],
+                _column_def["is_nullable"],
+            )
+        )
 
     # Definition of primary key
     _primary_key = ""
@@ -300,28 +411,26 @@ def create_statement(
     )
 
 
-def insert_statement(
-    table_name: str,
+def prepare_table(
     table_def: dict[str, dict[str, str | bool | Optional[int]]],
     str_max_size: int,
     bin_max_size: int,
     int_max: int,
-) -> tuple[dict[str, Any], str]:
-    """Generate INSERT statement for given table.
+) -> list[Callable[[int], list[str]]]:
+    """Prepare generators of random values for all columns of the table.
     Args:
-        table_name (str): name of the table.
-        table_def (dict[str,dict[str, dict[str, str | bool | Optional[int]]]]):
+        table_def (dict[str, dict[str, str | bool | Optional[int]]]):
             definition of the table (see return val of
-            generate_table_definitions function).
+            build_table_definitions function).
         str_max_size (int): maximum size for strings (like varchar).
         bin_max_size (int): maximum size for bin arrays (like varbinary).
         int_max (int): maximum for integers.
     Returns:
-         tuple[dict[str, Any], str]: A dictionary with column values
-         and INSERT statement for given table
+         list[Callable[[int], list[str]]]: Generator of each column (in the
+            order of columns in the table), see compile_column_generator
     """
-    _values: dict[str, str] = {}
-    for _col_name, _col_def in table_def.items():
+    _generators: list[Callable[[int], list[str]]] = []
+    for _col_def in table_def.values():
         # Find the maximal size for varchar-like columns as minimum of
         #  their actual size and maximal size given as input
         _str_max_size = str_max_size
@@ -331,9 +440,8 @@ def insert_statement(
             _str_max_size = min(str_max_size, _col_def["max_length"])
             _bin_max_size = min(bin_max_size, _col_def["max_length"])
 
-        # Generates and append new entry
-        _values[_col_name] = str(
-            random_value(
+        _generators.append(
+            compile_column_generator(
                 _col_def["data_type"],
                 _str_max_size,
                 _bin_max_size,
@@ -341,7 +449,56 @@ def insert_statement(
                 NULL_PROBABILITY if _col_def["is_nullable"] else None,
             )
         )
-    return (_values, f"INSERT INTO {table_name} VALUES({','.join(_values.values())})")
+    return _generators
+
+
+def generate_unique_columns(
+    column_generators: list[Callable[[int], list[str]]],
+    number_of_rows: int,
+) -> list[list[str]]:
+    """Generate random values for columns that are unique together (e. g.
+        primary keys).
+    Note:
+        More candidates than needed are drawn at once and duplicates are
+        dropped, the process is repeated until there is enough of them.
+    Args:
+        column_generators (list[Callable[[int], list[str]]]): generators of
+            columns whose values are unique together (see prepare_table).
+        number_of_rows (int): how many values are generated for each column.
+    Returns:
+         list[list[str]]: Values of each column (in the order of generators)
+    """
+    # Dictionary keeps the order of keys (unlike the set)
+    _unique_keys: dict[tuple[str, ...], None] = {}
+    while len(_unique_keys) < number_of_rows:
+        _missing = number_of_rows - len(_unique_keys)
+        _candidates = [
+            _generate(int(_missing * primary_key_oversampling) + 1)
+            for _generate in column_generators
+        ]
+        for _key in zip(*_candidates):
+            _unique_keys[_key] = None
+
+    # Transpose keys back to columns
+    _keys = list(_unique_keys)[:number_of_rows]
+    return [list(_values) for _values in zip(*_keys)] or [[] for _ in column_generators]
+
+
+def insert_statements(table_name: str, columns: list[list[str]]) -> list[str]:
+    """Generate INSERT statements for given table from values of columns.
+    Args:
+        table_name (str): name of the table.
+        columns (list[list[str]]): values of each column of the table (in the
+            order of columns in the table).
+    Returns:
+         list[str]: INSERT statements (one per row, each terminated by
+         a semicolon and a new line) for given table
+    """
+    # Assemble rows from the columns (the prefix and the suffix
+    #   of statements are the same for all rows of the table)
+    _prefix = f"INSERT INTO {table_name} VALUES("
+    _suffix = ");\n"
+    return [_prefix + ",".join(_row) + _suffix for _row in zip(*columns)]
 
 
 def stream_create_statements(
@@ -353,36 +510,100 @@ def stream_create_statements(
 
     Args:
         table_definitions (dict): definition of the table (see return val of
-            generate_table_definitions function).
+            build_table_definitions function).
         output_stream (Callable[[str], None]): Function for data steaming,
-            typically just print.
+            typically a write method of the output.
         primary_keys (dict[str, Optional[list[str]]]): Map of primary keys
             following the logic TableName -> [Column1, Column2, ...]
     """
     for _table_name, _table_def in table_definitions.items():
         # Main loop for generation of CREATE statements for tables
-        _primary_keys = None
-        if _table_name in primary_keys.keys():
-            _primary_keys = primary_keys[_table_name]
-        output_stream(create_statement(_table_name, _table_def, _primary_keys) + ";\n")
+        output_stream(
+            create_statement(_table_name, _table_def, primary_keys.get(_table_name))
+            + ";\n"
+        )
+
+
+def generate_table_inserts(
+    table_name: str,
+    table_def: dict[str, dict[str, str | bool | Optional[int]]],
+    number_of_rows: int,
+    max_string_size: int,
+    max_binary_array_size: int,
+    integer_maximum: int,
+    primary_keys: Optional[list[str]],
+    random_seed: Optional[str],
+) -> str:
+    """Generate all INSERT statements for given table.
+    Note:
+        The random generator is re-seeded for each table, so the outcome
+        does not depend on the order (or the process) in which tables are
+        generated.
+    Args:
+        table_name (str): name of the table.
+        table_def (dict[str, dict[str, str | bool | Optional[int]]]):
+            definition of the table (see return val of
+            build_table_definitions function).
+        number_of_rows (int): how many rows are generated.
+        max_string_size (int): maximum size for strings (like varchar).
+        max_binary_array_size (int): maximum size for bin arrays (like
+            varbinary).
+        integer_maximum (int): maximum for integers.
+        primary_keys (Optional[list[str]]): List of columns that are primary
+            keys (or None if none of them is).
+        random_seed (Optional[str]): Seed for the random generator, if None,
+            outcome differs on each run.
+    Returns:
+        str: INSERT statements for the table, each terminated by
+            a semicolon and a new line
+    """
+    _RNG.seed(None if random_seed is None else f"{random_seed}:{table_name}")
+
+    # Columns are identified by their position in the table
+    _generators = prepare_table(
+        table_def, max_string_size, max_binary_array_size, integer_maximum
+    )
+    _columns: list[Optional[list[str]]] = [None] * len(_generators)
+
+    # Primary Keys must be unique, so they are generated first
+    if primary_keys:
+        _col_positions = {_col_name: _pos for _pos, _col_name in enumerate(table_def)}
+        _pk_positions = [_col_positions[_pk_col] for _pk_col in primary_keys]
+        _pk_columns = generate_unique_columns(
+            [_generators[_pos] for _pos in _pk_positions], number_of_rows
+        )
+        for _pos, _values in zip(_pk_positions, _pk_columns):
+            _columns[_pos] = _values
+
+    # Generate remaining columns (without any restriction)
+    for _pos, _values in enumerate(_columns):
+        if _values is None:
+            _columns[_pos] = _generators[_pos](number_of_rows)
+
+    return "".join(insert_statements(table_name, _columns))
 
 
 def stream_insert_statements(
+    table_definitions: dict,
     number_of_rows_per_table: dict,
-    output_stream: Callable[[str], None],
     max_string_size: int,
     max_binary_array_size: int,
     integer_maximum: int,
     max_rows_per_table: Optional[int],
     primary_keys: dict[str, Optional[list[str]]],
-) -> None:
+    random_seed: Optional[str],
+    number_of_processes: int,
+) -> Iterator[str]:
     """Stream INSERT statements.
+    Note:
+        Tables are generated in parallel by number_of_processes processes,
+        but they are yielded in the order of table_definitions.
 
     Args:
+        table_definitions (dict): definition of the table (see return val of
+            build_table_definitions function).
         number_of_rows_per_table (dict): Mapping following logic the logic
             TableName -> NumberOfRows
-        output_stream (Callable[[str], None]): Function for data steaming,
-            typically just print.
         max_string_size (int): maximum size for strings (like varchar).
         max_binary_array_size (int): maximum size for bin arrays (like
             varbinary).
@@ -391,43 +612,51 @@ def stream_insert_statements(
             if None, does not apply
         primary_keys (dict[str, Optional[list[str]]]): Map of primary keys
             following the logic TableName -> [Column1, Column2, ...]
+        random_seed (Optional[str]): Seed for the random generator, if None,
+            outcome differs on each run.
+        number_of_processes (int): How many processes generate tables, if 1,
+            tables are generated in the current process.
+    Yields:
+        str: INSERT statements of one table (table by table), each
+            terminated by a semicolon and a new line
     """
-    for _table_name, _table_def in _table_definitions.items():
-        # To guarantee uniqueness of Primary Keys:
-        _pk_set = set()
-
+    _tasks = []
+    for _table_name, _table_def in table_definitions.items():
         _rows_per_table: int = number_of_rows_per_table[_table_name]
         if max_rows_per_table is not None:
-            _rows_per_table = min(
-                max_rows_per_table, number_of_rows_per_table[_table_name]
-            )
+            _rows_per_table = min(max_rows_per_table, _rows_per_table)
 
-        pos = 0
-        while pos < _rows_per_table:
-            _col_values, _insert_stmt = insert_statement(
+        _tasks.append(
+            (
                 _table_name,
                 _table_def,
+                _rows_per_table,
                 max_string_size,
                 max_binary_array_size,
                 integer_maximum,
+                primary_keys.get(_table_name),
+                random_seed,
             )
+        )
+
+    if number_of_processes == 1:
+        yield from starmap(generate_table_inserts, _tasks)
+        return
+
+    with multiprocessing.Pool(number_of_processes) as _pool:
+        # Tables are independent of each other
+        yield from _pool.imap(_generate_table_inserts_task, _tasks)
 
-            # Check if the Primary Key is unique, if not, repeat the process
-            if (
-                _table_name in primary_keys.keys()
-                and primary_keys[_table_name] is not None
-            ):
-                _value: list = []
-                for _pk_col in primary_keys[_table_name]:
-                    _value.append(_col_values[_pk_col])
-                if tuple(_value) in _pk_set:
-                    # Hit the duplicate
-                    continue
-                else:
-                    _pk_set.add(tuple(_value))
 
-            output_stream(_insert_stmt + ";\n")
-            pos += 1
+def _generate_table_inserts_task(task: tuple) -> str:
+    """Unpack arguments of generate_table_inserts (Pool.imap passes only
+        a single argument).
+    Args:
+        task (tuple): Arguments of generate_table_inserts function.
+    Returns:
+        str: INSERT statements for the table (see generate_table_inserts)
+    """
+    return generate_table_inserts(*task)
 
 
 # -----------------------------------
@@ -435,26 +664,48 @@ def stream_insert_statements(
 
 # ==== ACTUAL "STAND-ALONE" PART ====
 if __name__ == "__main__":
+    # Decide whether generated outputs are written into a file or printed
+    if OUTPUT_FILE:
+        OUTPUT_IO: TextIO = Path(OUTPUT_FILE).open("w", buffering=OUTPUT_BUFFER_SIZE)
+    else:
+        OUTPUT_IO: TextIO = sys.stdout
+        # Do not flush on each new line (default when printed to terminal)
+        OUTPUT_IO.reconfigure(line_buffering=False)
+    OUTPUT_STREAM: Callable[[str], None] = OUTPUT_IO.write
+
     # Load primary keys
     _primary_keys = json.load(PRIMARY_KEYS_PATH.open())
 
     # === GENERATE CREATE STATEMENTS ===
-    _table_definitions: dict = generate_table_definitions(
-        *parse_csv(
-            SQL_STRUCTURE_PATH,
-            [
-                "TABLE_CATALOG",
+    _csv_columns = [
+        "TABLE_CATALOG",
+        "TABLE_SCHEMA",
+        "TABLE_NAME",
+        "COLUMN_NAME",
+        "ORDINAL_POSITION",
+        "COLUMN_DEFAULT",
+        "IS_NULLABLE",
+        "DATA_TYPE",
+        "CHARACTER_MAXIMUM_LENGTH",
+    ]
+    # Only these columns of the CSV are needed (others are skipped)
+    _used_columns = itemgetter(
+        *(
+            _csv_columns.index(_column)
+            for _column in [
                 "TABLE_SCHEMA",
                 "TABLE_NAME",
                 "COLUMN_NAME",
-                "ORDINAL_POSITION",
-                "COLUMN_DEFAULT",
                 "IS_NULLABLE",
                 "DATA_TYPE",
                 "CHARACTER_MAXIMUM_LENGTH",
-            ],
+            ]
         )
     )
+    with SQL_STRUCTURE_PATH.open(newline="") as _csv_file:
+        _table_definitions: dict = build_table_definitions(
+            map(_used_columns, csv.reader(_csv_file))
+        )
     if GENERATE_CREATE_STATEMENTS:
         stream_create_statements(_table_definitions, OUTPUT_STREAM, _primary_keys)
     # ----------------------------------
@@ -462,13 +713,20 @@ if __name__ == "__main__":
     # === GENERATE INSERT STATEMENTS ===
     if GENERATE_INSERT_STATEMENTS:
         _number_of_rows_per_table: dict = json.load(NUMBER_ROWS_PER_TABLE_PATH.open())
-        stream_insert_statements(
-            _number_of_rows_per_table,
-            OUTPUT_STREAM,
-            MAX_STRING_SIZE,
-            MAX_BINARY_ARRAY_SIZE,
-            INTEGER_MAXIMUM,
-            MAX_ROWS_PER_TABLE,
-            _primary_keys,
+        OUTPUT_IO.writelines(
+            stream_insert_statements(
+                _table_definitions,
+                _number_of_rows_per_table,
+                MAX_STRING_SIZE,
+                MAX_BINARY_ARRAY_SIZE,
+                INTEGER_MAXIMUM,
+                MAX_ROWS_PER_TABLE,
+                _primary_keys,
+                RANDOM_SEED,
+                NUMBER_OF_PROCESSES,
+            )
         )
+
+    # Write out whatever remains in the buffer
+    OUTPUT_IO.flush()
 # ----------------------------------